@@ -4,7 +4,6 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-import math
 import os
 import time
 from typing import Callable, Dict, List, Optional, Sequence, Union
@@ -13,6 +12,8 @@ from .utils.constants import DATE_FORMAT
 
 try:  # pragma: no cover - lightweight HTTP dependency
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:  # pragma: no cover
     requests = None  # type: ignore[assignment]
 
@@ -27,7 +28,7 @@ except ImportError:  # pragma: no cover
     pd = None  # type: ignore[assignment]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceCandle:
     """Represents OHLCV data for a given timestamp (date or intraday)."""
 
@@ -39,7 +40,7 @@ class PriceCandle:
     volume: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewsArticle:
     """Simple structure for future news providers."""
 
@@ -50,7 +51,7 @@ class NewsArticle:
     url: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeRecord:
     """Represents a disclosed trade (e.g., politician or insider trade)."""
 
@@ -79,6 +80,27 @@ class MarketDataProvider(ABC):
             interval: Bar size string supported by the provider.
         """
 
+    def get_price_series_batch(
+        self, symbols: Sequence[str], start_date: datetime, end_date: datetime, interval: str = "1d"
+    ) -> Dict[str, List[PriceCandle]]:
+        """Return candles for several symbols over one shared window.
+
+        Providers that can fetch many tickers per request should override this; the
+        default calls get_price_series once per symbol.
+
+        Args:
+            symbols: Equity tickers to fetch.
+            start_date: Inclusive range start as datetime.
+            end_date: Inclusive range end as datetime.
+            interval: Bar size string supported by the provider.
+
+        Returns:
+            Mapping of symbol to its candles, in the order symbols were given.
+        """
+        return {
+            symbol: list(self.get_price_series(symbol, start_date, end_date, interval=interval)) for symbol in symbols
+        }
+
 
 class NewsDataProvider(ABC):
     """Base interface for news providers."""
@@ -215,33 +237,93 @@ class YahooMarketDataProvider(MarketDataProvider):
         if pd is not None and isinstance(df.columns, pd.MultiIndex):  # pragma: no cover - defensive
             df = df.xs(symbol, axis=1, level=1)
 
-        candles: List[PriceCandle] = []
-        for idx, row in df.iterrows():
-            try:
-                open_price = float(row["Open"])
-                high_price = float(row["High"])
-                low_price = float(row["Low"])
-                close_price = float(row["Close"])
-                volume = int(row["Volume"])
-            except KeyError as exc:  # pragma: no cover - schema mismatch
-                raise ValueError("Unexpected response format from Yahoo Finance") from exc
-
-            # Skip incomplete rows with NaN OHLC values to avoid leaking gaps into indicators.
-            if any(math.isnan(value) for value in (open_price, high_price, low_price, close_price)):
-                continue
+        return self._candles_from_frame(symbol, df)
 
-            # Normalize tz-aware timestamps from yfinance.
-            current_ts = idx.to_pydatetime() if hasattr(idx, "to_pydatetime") else idx
-            candles.append(
-                PriceCandle(
-                    date=current_ts,
-                    open=round(open_price, 4),
-                    high=round(high_price, 4),
-                    low=round(low_price, 4),
-                    close=round(close_price, 4),
-                    volume=max(0, volume),
-                )
+    def get_price_series_batch(
+        self, symbols: Sequence[str], start_date: datetime, end_date: datetime, interval: str = "1d"
+    ) -> Dict[str, List[PriceCandle]]:
+        """Return Yahoo Finance candles for several symbols from one threaded download.
+
+        Args:
+            symbols: Equity tickers to fetch.
+            start_date: Inclusive window start as datetime.
+            end_date: Inclusive window end as datetime.
+            interval: Bar size accepted by Yahoo (e.g., '1d', '1h').
+
+        Returns:
+            Mapping of symbol to cleaned PriceCandle entries, in the order symbols were given.
+
+        Raises:
+            ValueError: If the date range is invalid or Yahoo returns no data for a symbol.
+        """
+        if start_date > end_date:
+            raise ValueError("start_date must be on or before end_date")
+        if len(symbols) <= 1:
+            return super().get_price_series_batch(symbols, start_date, end_date, interval=interval)
+
+        end_inclusive = end_date + timedelta(days=1)
+        df = self._download_fn(
+            tickers=list(symbols),
+            start=start_date,
+            end=end_inclusive,
+            interval=interval,
+            auto_adjust=False,
+            progress=False,
+            group_by="ticker",
+            threads=True,
+        )
+
+        if df is None or getattr(df, "empty", True):
+            raise ValueError(f"No price data returned for {', '.join(symbols)}")
+
+        returned = set(df.columns.get_level_values(0))
+        candles_by_symbol: Dict[str, List[PriceCandle]] = {}
+        for symbol in symbols:
+            if symbol not in returned:
+                raise ValueError(f"No price data returned for {symbol}")
+            candles_by_symbol[symbol] = self._candles_from_frame(symbol, df[symbol])
+        return candles_by_symbol
+
+    @staticmethod
+    def _candles_from_frame(symbol: str, df: "pd.DataFrame") -> List[PriceCandle]:
+        """Convert a single-ticker yfinance frame into sanitized candles.
+
+        Args:
+            symbol: Ticker the frame belongs to, used in error messages.
+            df: Frame with Open/High/Low/Close/Volume columns indexed by timestamp.
+
+        Returns:
+            PriceCandle entries rounded to 4 decimals with incomplete rows dropped.
+
+        Raises:
+            ValueError: If columns are missing or no complete rows remain.
+        """
+        try:
+            ohlc = df[["Open", "High", "Low", "Close"]].astype(float)
+            volumes = df["Volume"]
+        except KeyError as exc:  # pragma: no cover - schema mismatch
+            raise ValueError("Unexpected response format from Yahoo Finance") from exc
+
+        # Skip incomplete rows with NaN OHLC values to avoid leaking gaps into indicators.
+        complete = ohlc.notna().all(axis=1).to_numpy()
+        prices = ohlc[complete].to_numpy().tolist()
+        sizes = volumes[complete].fillna(0).clip(lower=0).astype("int64").tolist()
+        index = df.index[complete]
+        # Normalize tz-aware timestamps from yfinance.
+        timestamps = index.to_pydatetime() if hasattr(index, "to_pydatetime") else list(index)
+
+        # Python's round() is correctly rounded; DataFrame.round() scales and rints, which differs on ties.
+        candles = [
+            PriceCandle(
+                date=ts,
+                open=round(open_, 4),
+                high=round(high, 4),
+                low=round(low, 4),
+                close=round(close, 4),
+                volume=volume,
             )
+            for ts, (open_, high, low, close), volume in zip(timestamps, prices, sizes)
+        ]
 
         if not candles:
             raise ValueError(f"Price data unavailable for {symbol} in requested window")
@@ -285,14 +367,16 @@ class YahooNewsDataProvider(NewsDataProvider):
         ticker = self._client_factory(symbol)
         articles = getattr(ticker, "news", None) or []
 
+        # Compare raw epoch seconds so out-of-window articles never build a datetime.
+        window_start = datetime.combine(start_date, datetime.min.time()).timestamp()
+        window_end = datetime.combine(end_date + timedelta(days=1), datetime.min.time()).timestamp()
+
         results: List[NewsArticle] = []
         for article in articles:
             published_ts = article.get("providerPublishTime")
-            if published_ts is None:
+            if published_ts is None or not (window_start <= published_ts < window_end):
                 continue
             published_at = datetime.fromtimestamp(published_ts)
-            if not (start_date <= published_at.date() <= end_date):
-                continue
 
             results.append(
                 NewsArticle(
@@ -333,7 +417,7 @@ class FinnhubNewsDataProvider(NewsDataProvider):
         if requests is None:
             raise ImportError("requests is required for FinnhubNewsDataProvider")
         self._api_key = api_key or os.getenv("FINNHUB_API_KEY")
-        self._session = session or requests.Session()
+        self._session = session or _build_pooled_session()
         self._base_url = base_url.rstrip("/")
         self._retry_delay = max(rate_limit_retry_delay, 0)
         self._max_rate_limit_retries = max(max_rate_limit_retries, 0)
@@ -386,6 +470,39 @@ class FinnhubNewsDataProvider(NewsDataProvider):
             return response.json() or []
 
 
+def _build_pooled_session(pool_maxsize: int = 16) -> "requests.Session":
+    """Create a keep-alive session with a sized connection pool and 5xx retries.
+
+    429 responses are left to the caller's own rate-limit handling.
+
+    Args:
+        pool_maxsize: Connections kept open per host for concurrent requests.
+
+    Returns:
+        Configured requests.Session.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        # Retry-After would otherwise make urllib3 retry 429s under the provider's own loop.
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_NEWS_PROVIDER_REGISTRY: Dict[str, Callable[[], NewsDataProvider]] = {
+    "yahoo": YahooNewsDataProvider,
+    "finnhub": FinnhubNewsDataProvider,
+}
+
+
 def build_news_provider(provider_name: Optional[str]) -> Optional[NewsDataProvider]:
     """Instantiate a news provider declared in configuration.
 
@@ -402,14 +519,10 @@ def build_news_provider(provider_name: Optional[str]) -> Optional[NewsDataProvid
         return None
 
     provider_key = provider_name.strip().lower()
-    registry: Dict[str, Callable[[], NewsDataProvider]] = {
-        "yahoo": YahooNewsDataProvider,
-        "finnhub": FinnhubNewsDataProvider,
-    }
-
-    factory = registry.get(provider_key)
+    factory = _NEWS_PROVIDER_REGISTRY.get(provider_key)
     if factory is None:
-        raise ValueError(f"Unknown news provider '{provider_name}'. Available: {', '.join(sorted(registry.keys()))}")
+        available = ", ".join(sorted(_NEWS_PROVIDER_REGISTRY))
+        raise ValueError(f"Unknown news provider '{provider_name}'. Available: {available}")
     return factory()
 
 
@@ -1,7 +1,8 @@
 """Feature engineering helpers for the backend service."""
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Union
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from .data_provider import PriceCandle
 
@@ -11,6 +12,18 @@ class FeatureEngineeringError(ValueError):
 
 
 FeatureRow = Dict[str, Union[str, Optional[float]]]
+FeatureColumns = Dict[str, List[Optional[float]]]
+
+_WINDOWED_FEATURE_PREFIXES = ("sma_", "ema_", "volatility_")
+_RETURN_BASED_KINDS = frozenset({"return_pct", "volatility"})
+
+# Feature kind -> builder taking (close_prices, returns, window).
+_FEATURE_BUILDERS: Dict[str, Callable[[List[float], List[Optional[float]], int], List[Optional[float]]]] = {
+    "return_pct": lambda close_prices, returns, window: returns,
+    "sma": lambda close_prices, returns, window: _simple_moving_average(close_prices, window),
+    "ema": lambda close_prices, returns, window: _exponential_moving_average(close_prices, window),
+    "volatility": lambda close_prices, returns, window: _rolling_volatility(returns, window),
+}
 
 
 def compute_features(candles: List[PriceCandle], requested_features: Iterable[str]) -> List[FeatureRow]:
@@ -26,44 +39,80 @@ def compute_features(candles: List[PriceCandle], requested_features: Iterable[st
     Raises:
         FeatureEngineeringError: If the feature list is empty or contains unsupported names.
     """
-
-    feature_list = list(requested_features)
-    if not feature_list:
-        raise FeatureEngineeringError("features list cannot be empty")
-
-    close_prices = [candle.close for candle in candles]
-    returns = _compute_returns(close_prices)
-
-    computed: Dict[str, List[Optional[float]]] = {}
-    for name in feature_list:
-        if name == "return_pct":
-            computed[name] = returns
-        elif name.startswith("sma_"):
-            window = _parse_window(name, prefix="sma_")
-            computed[name] = _simple_moving_average(close_prices, window)
-        elif name.startswith("ema_"):
-            window = _parse_window(name, prefix="ema_")
-            computed[name] = _exponential_moving_average(close_prices, window)
-        elif name.startswith("volatility_"):
-            window = _parse_window(name, prefix="volatility_")
-            computed[name] = _rolling_volatility(returns, window)
-        else:
-            raise FeatureEngineeringError(f"unsupported feature '{name}'")
+    columns = compute_feature_columns([candle.close for candle in candles], requested_features)
 
     feature_rows: List[FeatureRow] = []
     for idx, candle in enumerate(candles):
         row: FeatureRow = {"date": candle.date.isoformat()}
-        for feature_name in feature_list:
-            value = computed[feature_name][idx]
-            if value is None:
-                row[feature_name] = None
-            else:
-                row[feature_name] = round(value, 4)
+        for feature_name, values in columns.items():
+            row[feature_name] = values[idx]
         feature_rows.append(row)
 
     return feature_rows
 
 
+def compute_feature_columns(close_prices: Sequence[float], requested_features: Iterable[str]) -> FeatureColumns:
+    """Compute the requested features as columns aligned with the close prices.
+
+    Columnar output avoids building a dict per candle when callers (e.g., the SQLite
+    cache writer) only need one feature series at a time.
+
+    Args:
+        close_prices: Ordered close prices used as raw inputs.
+        requested_features: Iterable of feature identifiers (e.g., sma_5).
+
+    Returns:
+        Dict keyed by feature name where each value holds one rounded entry per close
+        price (None for insufficient history).
+
+    Raises:
+        FeatureEngineeringError: If the feature list is empty or contains unsupported names.
+    """
+
+    feature_list = list(requested_features)
+    if not feature_list:
+        raise FeatureEngineeringError("features list cannot be empty")
+
+    # Parse and validate every name before computing anything; duplicates collapse to one column.
+    specs = {name: _parse_feature(name) for name in feature_list}
+
+    close_prices = list(close_prices)
+    # Returns are only materialized when a requested feature depends on them.
+    needs_returns = any(kind in _RETURN_BASED_KINDS for kind, _ in specs.values())
+    returns = _compute_returns(close_prices) if needs_returns else []
+
+    computed: FeatureColumns = {
+        name: _FEATURE_BUILDERS[kind](close_prices, returns, window) for name, (kind, window) in specs.items()
+    }
+
+    return {
+        name: [None if value is None else round(value, 4) for value in values] for name, values in computed.items()
+    }
+
+
+@lru_cache(maxsize=256)
+def _parse_feature(feature_name: str) -> Tuple[str, int]:
+    """Split a feature identifier into its kind and window length.
+
+    Results are memoized since refresh jobs request the same names for every symbol.
+
+    Args:
+        feature_name: Identifier such as "sma_10" or "return_pct".
+
+    Returns:
+        Tuple of feature kind (e.g., "sma") and window length (0 for return_pct).
+
+    Raises:
+        FeatureEngineeringError: If the name is unsupported or carries an invalid window.
+    """
+    if feature_name == "return_pct":
+        return "return_pct", 0
+    for prefix in _WINDOWED_FEATURE_PREFIXES:
+        if feature_name.startswith(prefix):
+            return prefix[:-1], _parse_window(feature_name, prefix=prefix)
+    raise FeatureEngineeringError(f"unsupported feature '{feature_name}'")
+
+
 def _parse_window(feature_name: str, prefix: str) -> int:
     """Extract the trailing integer window length from a feature name.
 
@@ -100,15 +149,14 @@ def _simple_moving_average(values: List[float], window: int) -> List[Optional[fl
     """
     results: List[Optional[float]] = []
     cumulative = 0.0
-    window_values: List[float] = []
-    for value in values:
-        window_values.append(value)
+    for idx, value in enumerate(values):
         cumulative += value
-        if len(window_values) < window:
+        if idx >= window:
+            # Drop the value leaving the window by index instead of popping from a list head.
+            cumulative -= values[idx - window]
+        if idx < window - 1:
             results.append(None)
             continue
-        if len(window_values) > window:
-            cumulative -= window_values.pop(0)
         results.append(cumulative / window)
     return results
 
@@ -167,15 +215,21 @@ def _rolling_volatility(returns: List[Optional[float]], window: int) -> List[Opt
     """
     numeric_returns = [r if r is not None else 0.0 for r in returns]
     results: List[Optional[float]] = []
-    window_values: List[float] = []
-    for value in numeric_returns:
-        window_values.append(value)
-        if len(window_values) < window:
+    # Running sum and sum of squares yield mean and variance in one O(1) step per value.
+    window_sum = 0.0
+    window_sq_sum = 0.0
+    for idx, value in enumerate(numeric_returns):
+        window_sum += value
+        window_sq_sum += value * value
+        if idx >= window:
+            dropped = numeric_returns[idx - window]
+            window_sum -= dropped
+            window_sq_sum -= dropped * dropped
+        if idx < window - 1:
             results.append(None)
             continue
-        if len(window_values) > window:
-            window_values.pop(0)
-        mean = sum(window_values) / window
-        variance = sum((val - mean) ** 2 for val in window_values) / window
+        mean = window_sum / window
+        # Clamp tiny negative values caused by floating-point cancellation.
+        variance = max(window_sq_sum / window - mean * mean, 0.0)
         results.append(variance ** 0.5)
     return results
@@ -1,7 +1,6 @@
 """SQLite-backed readers for cached market, feature, news, and trade data."""
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import date, datetime
 import sqlite3
 from typing import Dict, Iterable, List, Optional
@@ -76,12 +75,17 @@ def fetch_features(
     Returns:
         List of dicts keyed by feature name for each timestamp.
     """
-    feature_set = set(feature_filter) if feature_filter else None
-    params = [symbol, interval, start.isoformat(), end.isoformat()]
-    query = """
+    feature_names = list(dict.fromkeys(feature_filter)) if feature_filter else []
+    params: List[object] = [symbol, interval, start.isoformat(), end.isoformat()]
+    name_clause = ""
+    if feature_names:
+        # Push the name filter into SQLite so unrequested feature rows are never materialized.
+        name_clause = f"AND feature_name IN ({', '.join('?' for _ in feature_names)})"
+        params.extend(feature_names)
+    query = f"""
         SELECT ts, feature_name, value
         FROM features
-        WHERE symbol = ? AND interval = ? AND ts >= ? AND ts <= ?
+        WHERE symbol = ? AND interval = ? AND ts >= ? AND ts <= ? {name_clause}
         ORDER BY ts ASC
     """
     try:
@@ -90,14 +94,15 @@ def fetch_features(
     except sqlite3.OperationalError:
         return []
 
-    grouped: Dict[str, Dict] = defaultdict(lambda: {"date": None})
+    grouped: Dict[str, Dict] = {}
     for ts, name, value in rows:
-        if feature_set and name not in feature_set:
-            continue
-        grouped[ts]["date"] = ts
-        grouped[ts][name] = value
+        row = grouped.get(ts)
+        if row is None:
+            row = grouped[ts] = {"date": ts}
+        row[name] = value
 
-    return [grouped[key] for key in sorted(grouped.keys())]
+    # Rows arrive ORDER BY ts and dicts keep insertion order, so no re-sort is needed.
+    return list(grouped.values())
 
 
 def fetch_news(
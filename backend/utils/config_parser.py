@@ -1,21 +1,35 @@
 """Config loader utilities for automation and other backend services."""
 from __future__ import annotations
 
+import copy
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Mapping, Optional, Sequence
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
 
 import yaml
 
+try:  # pragma: no cover - libyaml bindings ship with most PyYAML wheels
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - fall back to the pure-Python parser
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass(frozen=True)
+DEFAULT_CONFIG_PATH = (Path(__file__).parents[1] / "config" / "data-settings.yaml").resolve()
+
+# Parsed settings files keyed by resolved path -> (mtime_ns, size, parsed mapping).
+_YAML_CACHE: OrderedDict[Path, Tuple[int, int, Dict[str, Any]]] = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 32
+
+
+@dataclass(frozen=True, slots=True)
 class PriceConfig:
     tickers: Sequence[str]
     lookback_days: int
     interval: str = "1d"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageConfig:
     engine: str
     location: str
@@ -23,13 +37,13 @@ class StorageConfig:
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainConfig:
     provider: Optional[str] = None
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvironmentConfig:
     env: str
     location: str
@@ -54,18 +68,74 @@ def load_automation_config(env: str, config_path: Path | None = None) -> Environ
     Raises:
         ValueError: If the requested environment is missing in the config file.
     """
-    path = config_path or Path(__file__).resolve().parents[1] / "config" / "data-settings.yaml"
-    with path.open("r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh) or {}
+    path = DEFAULT_CONFIG_PATH if config_path is None else config_path.resolve()
+    stat = path.stat()
+    return _build_environment_config(path, stat.st_mtime_ns, stat.st_size, env)
+
+
+@lru_cache(maxsize=32)
+def _build_environment_config(path: Path, mtime_ns: int, size: int, env: str) -> EnvironmentConfig:
+    """Build the typed config for one environment, memoized per file version.
+
+    Args:
+        path: Resolved settings file path.
+        mtime_ns: File modification time; part of the cache key so edits invalidate it.
+        size: File size in bytes; part of the cache key alongside mtime_ns.
+        env: Name of the environment to load.
+
+    Returns:
+        Immutable EnvironmentConfig shared by every caller asking for the same file version.
+
+    Raises:
+        ValueError: If the requested environment is missing in the config file.
+    """
+    raw = load_settings_file(path)
     envs: Mapping[str, dict] = raw.get("environments", {})
     if env not in envs:
         raise ValueError(f"Unknown automation env '{env}'. Available: {', '.join(envs)}")
     cfg = envs[env]
+    price_cfg = dict(cfg["price"])
+    if "tickers" in price_cfg:
+        # Cached instances are shared, so keep the ticker list immutable.
+        price_cfg["tickers"] = tuple(price_cfg["tickers"])
     return EnvironmentConfig(
         env=cfg["env"],
         location=cfg["location"],
         storage=StorageConfig(**cfg["storage"]),
-        price=PriceConfig(**cfg["price"]),
+        price=PriceConfig(**price_cfg),
         news=DomainConfig(**cfg.get("news", {})),
         trades=DomainConfig(**cfg.get("trades", {})),
     )
+
+
+def clear_config_cache() -> None:
+    """Drop cached settings so the next load re-reads from disk.
+
+    Edits are normally picked up through the mtime/size check; this is for callers that
+    rewrite a file within the filesystem's timestamp resolution (e.g., tests).
+    """
+    _YAML_CACHE.clear()
+    _build_environment_config.cache_clear()
+
+
+def load_settings_file(path: Path = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
+    """Parse a YAML settings file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        path: Settings file to read; defaults to backend/config/data-settings.yaml.
+
+    Returns:
+        Deep copy of the parsed mapping (empty when the file is blank), so callers may mutate it.
+    """
+    resolved = path.resolve()
+    stat = resolved.stat()
+    cached = _YAML_CACHE.get(resolved)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        with resolved.open("r", encoding="utf-8") as fh:
+            raw = yaml.load(fh, Loader=_YamlLoader) or {}
+        cached = (stat.st_mtime_ns, stat.st_size, raw)
+        _YAML_CACHE[resolved] = cached
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+    _YAML_CACHE.move_to_end(resolved)
+    return copy.deepcopy(cached[2])
@@ -1,16 +1,11 @@
 """Shared constants for backend service."""
 from __future__ import annotations
 
-from pathlib import Path
-
-import yaml
-
-from .config_parser import load_automation_config
+from .config_parser import load_automation_config, load_settings_file
 
 DATE_FORMAT = "%Y-%m-%d"
 
 _DEFAULT_AUTOMATION_ENV = "dev"
-_CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "data-settings.yaml"
 
 # TODO: DATA_DB_PATH to be set as a required argument for the file that runs the features, remove the helper functions from this file
 def _get_configured_env() -> str:
@@ -22,8 +17,7 @@ def _get_configured_env() -> str:
     Raises:
         RuntimeError: If the config file lacks environments or references a missing one.
     """
-    with _CONFIG_PATH.open("r", encoding="utf-8") as fh:
-        config = yaml.safe_load(fh) or {}
+    config = load_settings_file()
 
     environments = config.get("environments") or {}
     if not environments:
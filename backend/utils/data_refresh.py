@@ -1,8 +1,9 @@
 """Data backfill and incremental update helpers for prices/features, news, and trades."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Iterable, Optional, Sequence
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
 from .constants import (
     DATA_DB_PATH,
@@ -13,12 +14,46 @@ from .constants import (
 from . import db
 from ..data_provider import (
     MarketDataProvider,
+    NewsArticle,
     NewsDataProvider,
     PriceCandle,
     TradeDataProvider,
+    TradeRecord,
     YahooMarketDataProvider,
 )
 
+_T = TypeVar("_T")
+
+# Provider calls for news/trades are network-bound, so a few threads overlap the round-trips.
+_DEFAULT_FETCH_WORKERS = 4
+
+
+def _fetch_each(fetch: Callable[[str], _T], symbols: Sequence[str], max_workers: int) -> List[Tuple[str, _T]]:
+    """Run fetch for every symbol on a thread pool and return results in symbol order.
+
+    All fetches finish before this returns, so the caller's SQLite writes stay on one
+    connection and a failed write cannot leave provider calls running in the background.
+
+    Args:
+        fetch: Provider call taking a symbol.
+        symbols: Sequence of tickers to fetch.
+        max_workers: Upper bound on concurrent fetches; 1 or less fetches serially.
+
+    Returns:
+        List of (symbol, fetch result) pairs.
+    """
+    if max_workers <= 1 or len(symbols) <= 1:
+        return [(symbol, fetch(symbol)) for symbol in symbols]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+        futures = [executor.submit(fetch, symbol) for symbol in symbols]
+        try:
+            return [(symbol, future.result()) for symbol, future in zip(symbols, futures)]
+        finally:
+            # On the first failure, drop fetches that have not started yet.
+            for future in futures:
+                future.cancel()
+
 
 def run_setup(db_path: str) -> None:
     """Drop and recreate the prices/features tables in the SQLite database.
@@ -49,15 +84,17 @@ def run_backfill_prices(
         feature_names: Optional list of feature IDs to recompute; defaults to PRICE_DEFAULT_FEATURES.
         db_path: SQLite database location for cached tables.
     """
-    start_date = datetime.utcnow() - timedelta(days=days)
     end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=days)
 
     with db.connect(db_path) as conn:
         db.drop_and_create_price_tables(conn)
-        for symbol in symbols:
-            candles = provider.get_price_series(symbol, start_date, end_date, interval=interval)
+        # Every symbol shares one window, so providers can fetch them in a single batch.
+        candles_by_symbol = provider.get_price_series_batch(symbols, start_date, end_date, interval=interval)
+        for symbol, candles in candles_by_symbol.items():
             db.upsert_prices(conn, symbol, interval, candles, replace_existing=True)
-            db.recompute_features(conn, symbol, interval, feature_names or PRICE_DEFAULT_FEATURES)
+            # The tables were just recreated, so the fetched candles are the full history.
+            db.recompute_features(conn, symbol, interval, feature_names or PRICE_DEFAULT_FEATURES, candles=candles)
 
 
 def run_incremental_update_prices(
@@ -79,11 +116,11 @@ def run_incremental_update_prices(
         db_path: SQLite database location for cached tables.
         lookback_if_empty_days: Days to backfill when cache is empty.
     """
+    end_date = datetime.utcnow()
     with db.connect(db_path) as conn:
         db.ensure_price_tables(conn)
         for symbol in symbols:
             start_ts = db.next_start_timestamp(conn, symbol, interval, lookback_if_empty_days)
-            end_date = datetime.utcnow()
             candles = provider.get_price_series(symbol, start_ts, end_date, interval=interval)
             db.upsert_prices(conn, symbol, interval, candles, replace_existing=False)
             db.recompute_features(conn, symbol, interval, feature_names or PRICE_DEFAULT_FEATURES)
@@ -133,6 +170,7 @@ def run_backfill_news(
     days: int = NEWS_DEFAULT_LOOKBACK_DAYS,
     db_path: str = DATA_DB_PATH,
     news_provider: NewsDataProvider = None,  # type: ignore[assignment]
+    max_workers: int = _DEFAULT_FETCH_WORKERS,
 ) -> None:
     """Backfill news articles for symbols by dropping and recreating the news table.
 
@@ -141,6 +179,7 @@ def run_backfill_news(
         days: Lookback period in days to capture.
         db_path: SQLite database location that stores the news table.
         news_provider: Provider implementation used to fetch articles.
+        max_workers: Maximum number of symbols fetched concurrently.
 
     Raises:
         ValueError: If a news_provider is not supplied.
@@ -148,13 +187,13 @@ def run_backfill_news(
     if news_provider is None:
         raise ValueError("news_provider is required")
 
-    start_date = datetime.utcnow().date() - timedelta(days=days)
     end_date = datetime.utcnow().date()
+    start_date = end_date - timedelta(days=days)
 
     with db.connect(db_path) as conn:
         db.drop_and_create_news_table(conn)
-        for symbol in symbols:
-            articles = news_provider.get_news(symbol, start_date, end_date)
+        fetched = _fetch_each(lambda symbol: news_provider.get_news(symbol, start_date, end_date), symbols, max_workers)
+        for symbol, articles in fetched:
             db.upsert_news(conn, symbol, articles, replace_existing=True)
 
 
@@ -163,6 +202,7 @@ def run_incremental_update_news(
     db_path: str = DATA_DB_PATH,
     news_provider: NewsDataProvider = None,  # type: ignore[assignment]
     lookback_if_empty_days: int = NEWS_DEFAULT_LOOKBACK_DAYS,
+    max_workers: int = _DEFAULT_FETCH_WORKERS,
 ) -> None:
     """Upsert news articles; uses recent lookback if table is empty.
 
@@ -171,6 +211,7 @@ def run_incremental_update_news(
         db_path: SQLite database location that stores the news table.
         news_provider: Provider implementation used to fetch articles.
         lookback_if_empty_days: Lookback to seed the table if no rows exist.
+        max_workers: Maximum number of symbols fetched concurrently.
 
     Raises:
         ValueError: If a news_provider is not supplied.
@@ -178,12 +219,15 @@ def run_incremental_update_news(
     if news_provider is None:
         raise ValueError("news_provider is required")
 
+    end_date = datetime.utcnow().date()
     with db.connect(db_path) as conn:
         db.ensure_news_table(conn)
-        for symbol in symbols:
-            start_date = db.next_news_start_date(conn, symbol, lookback_if_empty_days)
-            end_date = datetime.utcnow().date()
-            articles = news_provider.get_news(symbol, start_date, end_date)
+        start_dates = {symbol: db.next_news_start_date(conn, symbol, lookback_if_empty_days) for symbol in symbols}
+
+        def fetch(symbol: str) -> Sequence[NewsArticle]:
+            return news_provider.get_news(symbol, start_dates[symbol], end_date)
+
+        for symbol, articles in _fetch_each(fetch, symbols, max_workers):
             db.upsert_news(conn, symbol, articles, replace_existing=False)
 
 
@@ -192,6 +236,7 @@ def run_backfill_trades(
     days: int,
     db_path: str = DATA_DB_PATH,
     trade_provider: TradeDataProvider = None,  # type: ignore[assignment]
+    max_workers: int = _DEFAULT_FETCH_WORKERS,
 ) -> None:
     """Backfill trade disclosures by dropping and recreating the trades table.
 
@@ -200,6 +245,7 @@ def run_backfill_trades(
         days: Lookback period in days to fetch.
         db_path: SQLite database location for the trades table.
         trade_provider: Provider implementation used to fetch trade records.
+        max_workers: Maximum number of symbols fetched concurrently.
 
     Raises:
         ValueError: If trade_provider is not supplied.
@@ -207,13 +253,15 @@ def run_backfill_trades(
     if trade_provider is None:
         raise ValueError("trade_provider is required")
 
-    start_date = datetime.utcnow().date() - timedelta(days=days)
     end_date = datetime.utcnow().date()
+    start_date = end_date - timedelta(days=days)
 
     with db.connect(db_path) as conn:
         db.drop_and_create_trades_table(conn)
-        for symbol in symbols:
-            trades = trade_provider.get_trades(symbol, start_date, end_date)
+        fetched = _fetch_each(
+            lambda symbol: trade_provider.get_trades(symbol, start_date, end_date), symbols, max_workers
+        )
+        for symbol, trades in fetched:
             db.upsert_trades(conn, symbol, trades, replace_existing=True)
 
 
@@ -222,6 +270,7 @@ def run_incremental_update_trades(
     db_path: str = DATA_DB_PATH,
     trade_provider: TradeDataProvider = None,  # type: ignore[assignment]
     lookback_if_empty_days: int = TRADES_DEFAULT_LOOKBACK_DAYS,
+    max_workers: int = _DEFAULT_FETCH_WORKERS,
 ) -> None:
     """Upsert new trade disclosures; seeds with lookback if empty.
 
@@ -230,6 +279,7 @@ def run_incremental_update_trades(
         db_path: SQLite database location for the trades table.
         trade_provider: Provider implementation used to fetch trade records.
         lookback_if_empty_days: Lookback window if the cache lacks data.
+        max_workers: Maximum number of symbols fetched concurrently.
 
     Raises:
         ValueError: If trade_provider is not supplied.
@@ -237,10 +287,13 @@ def run_incremental_update_trades(
     if trade_provider is None:
         raise ValueError("trade_provider is required")
 
+    end_date = datetime.utcnow().date()
     with db.connect(db_path) as conn:
         db.ensure_trades_table(conn)
-        for symbol in symbols:
-            start_date = db.next_trades_start_date(conn, symbol, lookback_if_empty_days)
-            end_date = datetime.utcnow().date()
-            trades = trade_provider.get_trades(symbol, start_date, end_date)
+        start_dates = {symbol: db.next_trades_start_date(conn, symbol, lookback_if_empty_days) for symbol in symbols}
+
+        def fetch(symbol: str) -> Sequence[TradeRecord]:
+            return trade_provider.get_trades(symbol, start_dates[symbol], end_date)
+
+        for symbol, trades in _fetch_each(fetch, symbols, max_workers):
             db.upsert_trades(conn, symbol, trades, replace_existing=False)
@@ -3,13 +3,38 @@ from __future__ import annotations
 
 import sqlite3
 from datetime import date, datetime, timedelta
-from typing import Iterable, List
+from typing import Dict, Iterable, Optional, Sequence
 
 from ..data_provider import NewsArticle, PriceCandle, TradeRecord
-from ..feature_engineering import compute_features
+from ..feature_engineering import compute_feature_columns
 from .constants import DATA_DB_PATH
 
 
+def _upsert_statements(table: str, columns: Sequence[str]) -> Dict[bool, str]:
+    """Build the INSERT statements for a table keyed by `replace_existing`.
+
+    Args:
+        table: Target table name.
+        columns: Ordered column names matching the row tuples passed to executemany.
+
+    Returns:
+        Mapping of True to the INSERT OR REPLACE statement and False to INSERT OR IGNORE.
+    """
+    placeholders = ", ".join("?" for _ in columns)
+    template = f"INSERT OR {{conflict}} INTO {table} ({', '.join(columns)}) VALUES ({placeholders});"
+    return {True: template.format(conflict="REPLACE"), False: template.format(conflict="IGNORE")}
+
+
+_PRICES_UPSERT_SQL = _upsert_statements(
+    "prices", ("symbol", "ts", "interval", "open", "high", "low", "close", "volume")
+)
+_FEATURES_UPSERT_SQL = _upsert_statements("features", ("symbol", "ts", "interval", "feature_name", "value"))
+_NEWS_UPSERT_SQL = _upsert_statements("news", ("symbol", "published_at", "headline", "summary", "url"))
+_TRADES_UPSERT_SQL = _upsert_statements(
+    "trades", ("symbol", "executed_at", "trader", "action", "quantity", "price", "source")
+)
+
+
 def connect(db_path: str = DATA_DB_PATH) -> sqlite3.Connection:
     """Open a SQLite connection configured for WAL mode.
 
@@ -97,7 +122,13 @@ def ensure_price_tables(conn: sqlite3.Connection) -> None:
 
 
 def recompute_features(
-    conn: sqlite3.Connection, symbol: str, interval: str, feature_names: Iterable[str], *, replace_existing: bool = True
+    conn: sqlite3.Connection,
+    symbol: str,
+    interval: str,
+    feature_names: Iterable[str],
+    *,
+    replace_existing: bool = True,
+    candles: Optional[Sequence[PriceCandle]] = None,
 ) -> None:
     """Recompute feature rows for a symbol/interval pair.
 
@@ -107,35 +138,31 @@ def recompute_features(
         interval: Price interval string (e.g., '1d').
         feature_names: Iterable of feature identifiers to compute.
         replace_existing: Ignored (kept for API symmetry); always replaces rows.
+        candles: Optional full price history the caller just wrote with INSERT OR REPLACE; when
+            provided the prices table is not re-read. Duplicate timestamps keep the last candle and
+            rows are ordered like the stored ts column, so the series matches a re-read.
     """
     conn.execute("DELETE FROM features WHERE symbol = ? AND interval = ?;", (symbol, interval))
-    cursor = conn.execute(
-        "SELECT ts, open, high, low, close, volume FROM prices WHERE symbol = ? AND interval = ? ORDER BY ts ASC;",
-        (symbol, interval),
-    )
-    rows = cursor.fetchall()
-    candles: List[PriceCandle] = [
-        PriceCandle(
-            date=datetime.fromisoformat(ts),
-            open=open_,
-            high=high,
-            low=low,
-            close=close,
-            volume=volume,
-        )
-        for ts, open_, high, low, close, volume in rows
-    ]
-    computed = compute_features(candles, list(feature_names))
+    if candles is None:
+        # Stored timestamps are already ISO strings; keep them as-is instead of round-tripping through datetime.
+        rows = conn.execute(
+            "SELECT ts, close FROM prices WHERE symbol = ? AND interval = ? ORDER BY ts ASC;",
+            (symbol, interval),
+        ).fetchall()
+        timestamps = [ts for ts, _ in rows]
+        close_prices = [close for _, close in rows]
+    else:
+        # Mirror the prices table: INSERT OR REPLACE keeps the last bar per ts, and reads ORDER BY ts.
+        closes_by_ts = {candle.date.isoformat(): candle.close for candle in candles}
+        timestamps = sorted(closes_by_ts)
+        close_prices = [closes_by_ts[ts] for ts in timestamps]
+    columns = compute_feature_columns(close_prices, feature_names)
     feature_rows = [
-        (symbol, row["date"], interval, feature_name, value)
-        for row in computed
-        for feature_name, value in row.items()
-        if feature_name != "date"
+        (symbol, ts, interval, feature_name, value)
+        for feature_name, values in columns.items()
+        for ts, value in zip(timestamps, values)
     ]
-    conn.executemany(
-        "INSERT OR REPLACE INTO features (symbol, ts, interval, feature_name, value) VALUES (?, ?, ?, ?, ?);",
-        feature_rows,
-    )
+    conn.executemany(_FEATURES_UPSERT_SQL[True], feature_rows)
 
 
 def next_start_timestamp(conn: sqlite3.Connection, symbol: str, interval: str, lookback_if_empty_days: int) -> datetime:
@@ -183,8 +210,7 @@ def upsert_prices(conn: sqlite3.Connection, symbol: str, interval: str, candles:
         )
         for candle in candles
     ]
-    sql = "INSERT OR REPLACE INTO prices (symbol, ts, interval, open, high, low, close, volume) VALUES (?, ?, ?, ?, ?, ?, ?, ?);" if replace_existing else "INSERT OR IGNORE INTO prices (symbol, ts, interval, open, high, low, close, volume) VALUES (?, ?, ?, ?, ?, ?, ?, ?);"
-    conn.executemany(sql, rows)
+    conn.executemany(_PRICES_UPSERT_SQL[replace_existing], rows)
 
 
 def drop_and_create_news_table(conn: sqlite3.Connection) -> None:
@@ -238,8 +264,7 @@ def upsert_news(conn: sqlite3.Connection, symbol: str, articles: Iterable[NewsAr
         replace_existing: Whether to overwrite conflicts or ignore duplicates.
     """
     rows = [(symbol, article.published_at.isoformat(), article.headline, article.summary, article.url) for article in articles]
-    sql = "INSERT OR REPLACE INTO news (symbol, published_at, headline, summary, url) VALUES (?, ?, ?, ?, ?);" if replace_existing else "INSERT OR IGNORE INTO news (symbol, published_at, headline, summary, url) VALUES (?, ?, ?, ?, ?);"
-    conn.executemany(sql, rows)
+    conn.executemany(_NEWS_UPSERT_SQL[replace_existing], rows)
 
 
 def drop_and_create_trades_table(conn: sqlite3.Connection) -> None:
@@ -299,8 +324,7 @@ def upsert_trades(conn: sqlite3.Connection, symbol: str, trades: Iterable[TradeR
     rows = [
         (symbol, trade.executed_at.isoformat(), trade.trader, trade.action, trade.quantity, trade.price, trade.source) for trade in trades
     ]
-    sql = "INSERT OR REPLACE INTO trades (symbol, executed_at, trader, action, quantity, price, source) VALUES (?, ?, ?, ?, ?, ?, ?);" if replace_existing else "INSERT OR IGNORE INTO trades (symbol, executed_at, trader, action, quantity, price, source) VALUES (?, ?, ?, ?, ?, ?, ?);"
-    conn.executemany(sql, rows)
+    conn.executemany(_TRADES_UPSERT_SQL[replace_existing], rows)
 
 
 def next_news_start_date(conn: sqlite3.Connection, symbol: str, lookback_if_empty_days: int) -> date:
@@ -1,10 +1,13 @@
+from dataclasses import replace
 from datetime import date, timedelta
+import threading
 import time
 
 import pytest
 
 from backend import create_app
 from backend import automation, storage
+from backend.utils import db
 from tests.utils.synthetic_data_provider import SyntheticMarketDataProvider
 from tests.utils.synthetic_news_provider import SyntheticNewsProvider
 from tests.utils.synthetic_trade_provider import SyntheticTradeProvider
@@ -136,3 +139,127 @@ def test_incremental_prices_creates_tables_when_empty(temp_db):
     )
     prices = storage.fetch_prices("GOOG", start=date.today() - timedelta(days=2), end=date.today(), db_path=str(temp_db))
     assert prices
+
+
+def test_backfill_features_match_recompute_from_cache(temp_db):
+    """Features written during backfill match a recompute that re-reads cached prices.
+
+    Backfill reuses the fetched candles; recomputing from SQLite must produce identical rows.
+    """
+    automation.run_backfill_prices(
+        provider=SyntheticMarketDataProvider(),
+        symbols=["NVDA"],
+        days=10,
+        interval="1d",
+        feature_names=["sma_3", "volatility_3"],
+        db_path=str(temp_db),
+    )
+    window = dict(start=date.today() - timedelta(days=10), end=date.today() + timedelta(days=1))
+    backfilled = storage.fetch_features("NVDA", **window, db_path=str(temp_db))
+
+    with db.connect(str(temp_db)) as conn:
+        db.recompute_features(conn, "NVDA", "1d", ["sma_3", "volatility_3"])
+
+    assert backfilled
+    assert storage.fetch_features("NVDA", **window, db_path=str(temp_db)) == backfilled
+
+
+def test_fetch_features_filters_by_name(temp_db):
+    """Feature filter returns only the requested feature columns per timestamp."""
+    automation.run_backfill_prices(
+        provider=SyntheticMarketDataProvider(),
+        symbols=["AMD"],
+        days=5,
+        interval="1d",
+        feature_names=["sma_3", "ema_3", "volatility_3"],
+        db_path=str(temp_db),
+    )
+
+    rows = storage.fetch_features(
+        "AMD",
+        start=date.today() - timedelta(days=5),
+        end=date.today() + timedelta(days=1),
+        feature_filter=["sma_3", "ema_3"],
+        db_path=str(temp_db),
+    )
+
+    assert rows
+    assert all(set(row) == {"date", "sma_3", "ema_3"} for row in rows)
+
+
+def test_backfill_news_fetches_symbols_concurrently(temp_db):
+    """News backfill overlaps provider calls and still writes every symbol."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _BarrierNewsProvider(SyntheticNewsProvider):
+        def get_news(self, symbol, start_date, end_date):
+            barrier.wait()  # Only passes when two fetches are in flight together.
+            return super().get_news(symbol, start_date, end_date)
+
+    automation.run_backfill_news(
+        symbols=["AAPL", "MSFT"],
+        days=2,
+        db_path=str(temp_db),
+        news_provider=_BarrierNewsProvider(),
+        max_workers=2,
+    )
+
+    for symbol in ("AAPL", "MSFT"):
+        news = storage.fetch_news(
+            symbol,
+            start=date.today() - timedelta(days=2),
+            end=date.today() + timedelta(days=1),
+            db_path=str(temp_db),
+        )
+        assert news and all(item["headline"].startswith(f"Headline for {symbol}") for item in news)
+
+
+def test_backfill_features_tolerate_duplicate_and_unordered_bars(temp_db):
+    """Backfill features follow the stored series when the provider repeats or reorders bars."""
+
+    class _MessyProvider(SyntheticMarketDataProvider):
+        def get_price_series(self, symbol, start_date, end_date, interval="1d"):
+            candles = super().get_price_series(symbol, start_date, end_date, interval)
+            live_bar = replace(candles[-1], close=candles[-1].close + 5)
+            return [candles[2], *candles[:2], *candles[3:], live_bar]
+
+    automation.run_backfill_prices(
+        provider=_MessyProvider(),
+        symbols=["TSLA"],
+        days=10,
+        interval="1d",
+        feature_names=["sma_3", "return_pct"],
+        db_path=str(temp_db),
+    )
+    window = dict(start=date.today() - timedelta(days=10), end=date.today() + timedelta(days=1))
+    backfilled = storage.fetch_features("TSLA", **window, db_path=str(temp_db))
+
+    with db.connect(str(temp_db)) as conn:
+        db.recompute_features(conn, "TSLA", "1d", ["sma_3", "return_pct"])
+
+    assert backfilled
+    assert storage.fetch_features("TSLA", **window, db_path=str(temp_db)) == backfilled
+
+
+def test_backfill_news_leaves_no_fetches_running_after_write_failure(temp_db, monkeypatch):
+    """A failed write surfaces only after every provider call has finished."""
+    finished = []
+
+    class _SlowNewsProvider(SyntheticNewsProvider):
+        def get_news(self, symbol, start_date, end_date):
+            time.sleep(0.05)
+            finished.append(symbol)
+            return super().get_news(symbol, start_date, end_date)
+
+    def _failing_upsert(*_args, **_kwargs):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(db, "upsert_news", _failing_upsert)
+    symbols = ["AAPL", "MSFT", "NVDA", "AMD", "TSLA", "META"]
+
+    with pytest.raises(RuntimeError, match="disk full"):
+        automation.run_backfill_news(
+            symbols=symbols, days=1, db_path=str(temp_db), news_provider=_SlowNewsProvider(), max_workers=2
+        )
+
+    assert sorted(finished) == sorted(symbols)
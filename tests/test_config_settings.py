@@ -1,10 +1,13 @@
 """Tests for validating backend configuration files such as data-settings.yaml."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import yaml
 
+from backend.utils.config_parser import clear_config_cache, load_automation_config
+
 DATA_SETTINGS_PATH = Path("backend/config/data-settings.yaml")
 
 
@@ -27,3 +30,51 @@ def test_data_settings_yaml_is_valid_and_has_required_sections() -> None:
         assert isinstance(news_cfg, dict), f"{env_name} news section must be a mapping"
         provider = news_cfg.get("provider")
         assert isinstance(provider, str) and provider, f"{env_name} news provider must be specified"
+
+
+_MINIMAL_SETTINGS = """
+environments:
+  dev:
+    env: dev
+    location: local
+    storage: {{engine: sqlite, location: repo, path: {db}}}
+    price: {{tickers: [AAPL], lookback_days: 5}}
+"""
+
+
+def test_automation_config_reparses_when_file_changes(tmp_path: Path) -> None:
+    """Cached settings are reused until the file's mtime or size changes."""
+    settings = tmp_path / "settings.yaml"
+    settings.write_text(_MINIMAL_SETTINGS.format(db="first.db"), encoding="utf-8")
+    assert load_automation_config("dev", settings).storage.path == "first.db"
+
+    settings.write_text(_MINIMAL_SETTINGS.format(db="second.db"), encoding="utf-8")
+    stat = settings.stat()
+    os.utime(settings, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_automation_config("dev", settings).storage.path == "second.db"
+
+
+def test_automation_config_is_shared_and_immutable(tmp_path: Path) -> None:
+    """Repeated loads of an unchanged file return the same frozen config."""
+    settings = tmp_path / "settings.yaml"
+    settings.write_text(_MINIMAL_SETTINGS.format(db="data.db"), encoding="utf-8")
+
+    first = load_automation_config("dev", settings)
+
+    assert load_automation_config("dev", settings) is first
+    assert first.price.tickers == ("AAPL",)
+
+
+def test_clear_config_cache_forces_reload(tmp_path: Path) -> None:
+    """Clearing the cache re-reads a file even when mtime and size are unchanged."""
+    settings = tmp_path / "settings.yaml"
+    settings.write_text(_MINIMAL_SETTINGS.format(db="a.db"), encoding="utf-8")
+    stat = settings.stat()
+    assert load_automation_config("dev", settings).storage.path == "a.db"
+
+    settings.write_text(_MINIMAL_SETTINGS.format(db="b.db"), encoding="utf-8")
+    os.utime(settings, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    clear_config_cache()
+
+    assert load_automation_config("dev", settings).storage.path == "b.db"
@@ -4,9 +4,16 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any, Dict, List
 
+import pandas as pd
 import pytest
 
-from backend.data_provider import FinnhubNewsDataProvider, NewsArticle
+from backend.data_provider import (
+    FinnhubNewsDataProvider,
+    NewsArticle,
+    PriceCandle,
+    YahooMarketDataProvider,
+    YahooNewsDataProvider,
+)
 
 
 class _DummyResponse:
@@ -104,3 +111,94 @@ def test_finnhub_provider_retries_rate_limited_calls(monkeypatch: pytest.MonkeyP
     assert len(articles) == 1
     assert len(session.calls) == 2, "Expected the provider to retry after 429"
     assert articles[0].headline == "Recovered"
+
+
+def test_finnhub_default_session_pools_connections() -> None:
+    """Default Finnhub session reuses a sized pool and retries transient 5xx."""
+    provider = FinnhubNewsDataProvider(api_key="demo")
+
+    adapter = provider._session.get_adapter("https://finnhub.io/api/v1")
+
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] >= 8
+    assert adapter.max_retries.is_retry("GET", 503)
+    assert not adapter.max_retries.is_retry("GET", 429)
+    assert not adapter.max_retries.is_retry("GET", 429, has_retry_after=True)
+
+
+def test_yahoo_market_provider_builds_clean_candles() -> None:
+    """Yahoo frames are rounded like round(x, 4), NaN OHLC rows dropped, and volumes clamped at zero."""
+    frame = pd.DataFrame(
+        {
+            "Open": [10.123456, float("nan"), 12.0],
+            "High": [13.52535, 13.0, 12.5],
+            "Low": [9.5, 11.0, 11.75],
+            "Close": [10.5, 12.0, 92.59085],
+            "Adj Close": [10.5, 12.0, 92.59085],
+            "Volume": [1_000, float("nan"), -5],
+        },
+        index=pd.DatetimeIndex(["2024-01-02", "2024-01-03", "2024-01-04"], name="Date"),
+    )
+    provider = YahooMarketDataProvider(download_fn=lambda **_kwargs: frame)
+
+    candles = provider.get_price_series("AMD", datetime(2024, 1, 2), datetime(2024, 1, 4))
+
+    assert candles == [
+        # Ties follow Python's round(): 13.52535 -> 13.5253 and 92.59085 -> 92.5909.
+        PriceCandle(date=datetime(2024, 1, 2), open=10.1235, high=13.5253, low=9.5, close=10.5, volume=1_000),
+        PriceCandle(date=datetime(2024, 1, 4), open=12.0, high=12.5, low=11.75, close=92.5909, volume=0),
+    ]
+    assert all(type(candle.close) is float and type(candle.volume) is int for candle in candles)
+
+
+def test_yahoo_market_provider_batches_symbols_in_one_download() -> None:
+    """Batch fetch issues one threaded download and splits candles per ticker."""
+    index = pd.DatetimeIndex(["2024-01-02", "2024-01-03"], name="Date")
+    fields = ["Open", "High", "Low", "Close", "Volume"]
+    frame = pd.concat(
+        {
+            "AMD": pd.DataFrame([[1.0, 2.0, 0.5, 1.5, 10], [1.5, 2.5, 1.0, 2.0, 20]], index=index, columns=fields),
+            "NVDA": pd.DataFrame([[float("nan")] * 5, [5.0, 6.0, 4.0, 5.5, 30]], index=index, columns=fields),
+        },
+        axis=1,
+    )
+    calls: List[Dict[str, Any]] = []
+
+    def _download(**kwargs: Any) -> pd.DataFrame:
+        calls.append(kwargs)
+        return frame
+
+    provider = YahooMarketDataProvider(download_fn=_download)
+
+    batch = provider.get_price_series_batch(["AMD", "NVDA"], datetime(2024, 1, 2), datetime(2024, 1, 3))
+
+    assert len(calls) == 1
+    assert calls[0]["tickers"] == ["AMD", "NVDA"] and calls[0]["threads"] is True
+    assert list(batch) == ["AMD", "NVDA"]
+    assert [candle.close for candle in batch["AMD"]] == [1.5, 2.0]
+    assert batch["NVDA"] == [PriceCandle(date=datetime(2024, 1, 3), open=5.0, high=6.0, low=4.0, close=5.5, volume=30)]
+
+
+def test_yahoo_news_provider_filters_by_local_publication_date() -> None:
+    """Only articles published within the inclusive local-date window are returned."""
+    published = [
+        datetime(2024, 3, 4, 23, 59, 59),
+        datetime(2024, 3, 5, 0, 0),
+        datetime(2024, 3, 6, 23, 59, 59),
+        datetime(2024, 3, 7, 0, 0),
+    ]
+    news = [
+        {"title": f"story {idx}", "providerPublishTime": int(ts.timestamp()), "text": "body"}
+        for idx, ts in enumerate(published)
+    ]
+    news.append({"title": "undated"})
+
+    class _Ticker:
+        def __init__(self, symbol: str) -> None:
+            self.news = news
+
+    provider = YahooNewsDataProvider(client_factory=_Ticker)
+
+    articles = provider.get_news("AAPL", date(2024, 3, 5), date(2024, 3, 6))
+
+    assert [article.headline for article in articles] == ["story 1", "story 2"]
+    assert articles[0].published_at == published[1] and articles[0].summary == "body"
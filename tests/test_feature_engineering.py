@@ -0,0 +1,87 @@
+"""Tests for feature engineering helpers."""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from statistics import fmean, pstdev
+from typing import List, Optional
+
+import pytest
+
+from backend.data_provider import PriceCandle
+from backend.feature_engineering import (
+    FeatureEngineeringError,
+    _rolling_volatility,
+    _simple_moving_average,
+    compute_feature_columns,
+    compute_features,
+)
+
+CLOSES = [100.0, 101.5, 99.75, 102.25, 103.0, 101.0, 104.5, 105.25]
+
+
+def _candles(closes: List[float]) -> List[PriceCandle]:
+    start = datetime(2024, 1, 1)
+    return [
+        PriceCandle(date=start + timedelta(days=idx), open=close, high=close, low=close, close=close, volume=1_000)
+        for idx, close in enumerate(closes)
+    ]
+
+
+def test_feature_columns_match_feature_rows() -> None:
+    """Columnar output carries the same values as the per-candle rows."""
+    names = ["return_pct", "sma_3", "ema_4", "volatility_3"]
+    candles = _candles(CLOSES)
+
+    columns = compute_feature_columns(CLOSES, names)
+    rows = compute_features(candles, names)
+
+    assert list(columns) == names
+    for idx, row in enumerate(rows):
+        assert row["date"] == candles[idx].date.isoformat()
+        for name in names:
+            assert row[name] == columns[name][idx]
+
+
+def test_feature_columns_reject_empty_and_unknown_features() -> None:
+    """Invalid feature requests raise FeatureEngineeringError."""
+    with pytest.raises(FeatureEngineeringError, match="cannot be empty"):
+        compute_feature_columns(CLOSES, [])
+    with pytest.raises(FeatureEngineeringError, match="unsupported"):
+        compute_feature_columns(CLOSES, ["sma_3", "macd_3"])
+    with pytest.raises(FeatureEngineeringError, match="greater than 1"):
+        compute_feature_columns(CLOSES, ["ema_1"])
+
+
+def test_duplicate_feature_names_yield_single_column() -> None:
+    """Repeated feature names are computed once and keep first-seen order."""
+    columns = compute_feature_columns(CLOSES, ["sma_3", "return_pct", "sma_3"])
+
+    assert list(columns) == ["sma_3", "return_pct"]
+
+
+def test_rolling_volatility_matches_windowed_population_stdev() -> None:
+    """Running-sum volatility agrees with a direct per-window population stdev."""
+    rng = random.Random(7)
+    returns: List[Optional[float]] = [0.0] + [rng.gauss(0, 0.02) for _ in range(250)]
+    window = 10
+
+    result = _rolling_volatility(returns, window)
+
+    assert result[: window - 1] == [None] * (window - 1)
+    for idx in range(window - 1, len(returns)):
+        expected = pstdev(returns[idx - window + 1 : idx + 1])
+        assert result[idx] == pytest.approx(expected, abs=1e-12)
+
+
+def test_simple_moving_average_matches_windowed_mean() -> None:
+    """Running-sum SMA agrees with a direct mean over each window."""
+    rng = random.Random(11)
+    closes = [100 + rng.uniform(-5, 5) for _ in range(200)]
+    window = 20
+
+    result = _simple_moving_average(closes, window)
+
+    assert result[: window - 1] == [None] * (window - 1)
+    for idx in range(window - 1, len(closes)):
+        assert result[idx] == pytest.approx(fmean(closes[idx - window + 1 : idx + 1]), rel=1e-12)